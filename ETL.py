@@ -7,14 +7,21 @@ df = pd.read_csv("./app/data/smartphones.csv")
 # Create a 'features' list from boolean columns
 feature_cols = ["has_5g", "has_nfc", "has_ir_blaster", "extended_memory_available"]
 
-df["features"] = df[feature_cols].apply(
-    lambda x: [col.replace("_", " ") for col, val in x.items() if val], axis=1
-)
+# Iterate columns together instead of building a Series per row with apply(axis=1)
+feature_names = [col.replace("_", " ") for col in feature_cols]
+df["features"] = [
+    [name for name, val in zip(feature_names, vals) if val]
+    for vals in zip(*(df[col] for col in feature_cols))
+]
 
 # Generate 'details' column as description
-df["details"] = df.apply(
-    lambda row: f"{row['brand_name']} {row['model']} runs on {row['os']} with {row['ram_capacity']} RAM, {row['battery_capacity']} mAh battery and {row['primary_camera_rear']} rear camera.", axis=1
-)
+df["details"] = [
+    f"{brand} {model} runs on {os_name} with {ram} RAM, {battery} mAh battery and {camera} rear camera."
+    for brand, model, os_name, ram, battery, camera in zip(
+        df["brand_name"], df["model"], df["os"],
+        df["ram_capacity"], df["battery_capacity"], df["primary_camera_rear"]
+    )
+]
 
 # Select and rename columns
 df = df.rename(columns={